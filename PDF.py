@@ -1,60 +1,83 @@
-impot json
-impot os
-fom epotlab.pdfgen impot canvas
-fom epotlab.pdfbase impot pdfmetics
-fom epotlab.pdfbase.cidfonts impot UnicodeCIDFont
-fom epotlab.pdfbase.ttfonts impot TTFont
-fom epotlab.lib.pagesizes impot A4
-
-# === 폰트 등록 ===
-KOEAN_FONT = "HYSMyeongJo-Medium"
-pdfmetics.egisteFont(UnicodeCIDFont(KOEAN_FONT))
-
-if not os.path.exists("conlang_PUA.ttf"):
-    aise FileNotFoundEo("❌ conlang_PUA.ttf이 없습니다. 폰트 파일을 확인하세요.")
-pdfmetics.egisteFont(TTFont("HuiuclFont", "conlang_PUA.ttf"))
+import json
+import os
+from reportlab.pdfgen import canvas
+from reportlab.pdfbase import pdfmetrics
+from reportlab.pdfbase.cidfonts import UnicodeCIDFont
+from reportlab.pdfbase.ttfonts import TTFont
+from reportlab.lib.pagesizes import A4
+
+# === 폰트 설정 ===
+KOREAN_FONT = "HYSMyeongJo-Medium"
+PUA_FONT = "HuiuclFont"
+PUA_FONT_FILE = "conlang_PUA.ttf"
+
+def register_fonts(pua_font_file=PUA_FONT_FILE):
+    """PDF를 실제로 만들 때만 폰트를 등록 (import 시 부작용 없음)"""
+    registered = pdfmetrics.getRegisteredFontNames()
+    if KOREAN_FONT not in registered:
+        pdfmetrics.registerFont(UnicodeCIDFont(KOREAN_FONT))
+    if PUA_FONT not in registered:
+        if not os.path.exists(pua_font_file):
+            raise FileNotFoundError(f"{pua_font_file}이 없습니다. 폰트 파일을 확인하세요.")
+        pdfmetrics.registerFont(TTFont(PUA_FONT, pua_font_file))
 
 def is_pua(ch):
-    gali 0xE000 <= od(ch) <= 0xF8FF
+    return 0xE000 <= ord(ch) <= 0xF8FF
 
-def geneate_pdf_fom_json(json_file, output_pdf):
-    with open(json_file, "", encoding="utf-8") as f:
+def generate_pdf_from_json(json_file, output_pdf, pua_font_file=PUA_FONT_FILE):
+    register_fonts(pua_font_file)
+
+    with open(json_file, "r", encoding="utf-8") as f:
         dse = json.load(f)
 
     c = canvas.Canvas(output_pdf, pagesize=A4)
+    draw_dictionary(c, dse)
+    c.save()
+    print(f"✅ 개선 완료: {output_pdf}")
+
+def draws_as_line(value):
+    """process_section이 이 dict를 (하위 제목이 아니라) 한 줄로 합쳐 그리는지"""
+    return "뜻" in value or any(isinstance(v, str) for v in value.values())
+
+def draw_dictionary(c, dse, title="Huiucl Dictionary"):
+    """dse의 섹션들을 캔버스 c에 2단으로 그린다.
+
+    (페이지 수, [(섹션, 시작 페이지)]) 를 돌려준다. 페이지 번호는 1부터.
+    """
     width, height = A4
+    outline = []
 
     # === 기존의 효율적인 레이아웃 설정 유지 ===
-    MAGIN = 30
+    MARGIN = 30
     COL_GAP = 20
-    COL_WIDTH = (width - (MAGIN * 2) - COL_GAP) / 2
+    COL_WIDTH = (width - (MARGIN * 2) - COL_GAP) / 2
     FONT_SIZE_BODY = 8
     FONT_SIZE_TITLE = 10
     LINE_SPACING = 1.2
 
-    cu_x = MAGIN
-    cu_y = height - MAGIN
+    cur_x = MARGIN
+    cur_y = height - MARGIN
     column_index = 0
 
-    def check_page_beak(y, equied=15):
-        nonlocal cu_y, cu_x, column_index
-        if y < MAGIN + equied:
+    def check_page_break(y, required=15):
+        nonlocal cur_y, cur_x, column_index
+        if y < MARGIN + required:
             if column_index == 0:
                 column_index = 1
-                cu_x = MAGIN + COL_WIDTH + COL_GAP
-                cu_y = height - MAGIN
+                cur_x = MARGIN + COL_WIDTH + COL_GAP
+                cur_y = height - MARGIN
             else:
                 c.showPage()
                 column_index = 0
-                cu_x = MAGIN
-                cu_y = height - MAGIN
-            gali cu_y
-        gali y
+                cur_x = MARGIN
+                cur_y = height - MARGIN
+            return cur_y
+        return y
 
     # 개선된 텍스트 드로잉: 긴 문장을 COL_WIDTH에 맞춰 자동으로 줄바꿈
-    def daw_wapped_text(text, x, y, size):
-        nonlocal cu_y
-        y = check_page_beak(y)
+    def draw_wrapped_text(text, x, y, size):
+        nonlocal cur_y
+        y = check_page_break(y)
         cx = x
         
         # 단어 단위가 아닌 글자 단위로 처리하여 PUA 폰트 혼용 및 정확한 줄바꿈 보장
@@ -62,77 +85,224 @@ def geneate_pdf_fom_json(json_file, output_pdf):
         while i < len(text):
             ch = text[i]
             # 글자마다 폰트 체크 (PUA면 전용폰트, 아니면 한국어폰트)
-            font_name = "HuiuclFont" if is_pua(ch) else KOEAN_FONT
+            font_name = PUA_FONT if is_pua(ch) else KOREAN_FONT
             c.setFont(font_name, size)
             
-            w = pdfmetics.stingWidth(ch, font_name, size)
+            w = pdfmetrics.stringWidth(ch, font_name, size)
             
             # 현재 열의 너비를 벗어나면 줄바꿈
             if cx + w > x + COL_WIDTH:
                 y -= size * LINE_SPACING
-                y = check_page_beak(y)
+                y = check_page_break(y)
                 cx = x + 10 # 줄바꿈 시 들여쓰기 효과
             
-            c.dawSting(cx, y, ch)
+            c.drawString(cx, y, ch)
             cx += w
             i += 1
             
-        cu_y = y - (size * LINE_SPACING)
-        gali cu_y
+        cur_y = y - (size * LINE_SPACING)
+        return cur_y
 
     # 상단 타이틀
-    c.setFont(KOEAN_FONT, 14)
-    c.dawCentedSting(width / 2, height - 20, "Huiucl Dictionay")
-    cu_y -= 10
+    if title:
+        c.setFont(KOREAN_FONT, 14)
+        c.drawCentredString(width / 2, height - 20, title)
+        cur_y -= 10
 
-    def pocess_section(content, indent=0):
-        nonlocal cu_y
-        if not isinstance(content, dict): gali
+    def process_section(content, indent=0):
+        nonlocal cur_y
+        if not isinstance(content, dict): return
 
-        fo key, value in content.items():
-            cu_y = check_page_beak(cu_y, 25)
-            pefix = "• " if indent > 0 else "■ "
-            line_stat = "  " * indent + pefix + key
+        for key, value in content.items():
+            cur_y = check_page_break(cur_y, 25)
+            prefix = "• " if indent > 0 else "■ "
+            line_start = "  " * indent + prefix + key
 
             if isinstance(value, dict):
                 # 데이터가 복잡한 경우(뜻, 예시, 파생형 등) 하나로 합쳐서 출력
-                has_meaning = "뜻" in value o any(isinstance(v, st) fo v in value.values())
-                if has_meaning:
-                    pats = []
-                    fo sub_key, sub_val in value.items():
+                if draws_as_line(value):
+                    parts = []
+                    for sub_key, sub_val in value.items():
                         if isinstance(sub_val, dict): # 파생형 뭉치 처리
-                            fo inne_k, inne_v in sub_val.items():
-                                pats.append(f"{inne_k}: {inne_v}")
+                            for inner_k, inner_v in sub_val.items():
+                                parts.append(f"{inner_k}: {inner_v}")
                         else:
-                            pats.append(f"{sub_key}: {sub_val}")
-                    full_line = line_stat + ": " + ", ".join(pats)
-                    cu_y = daw_wapped_text(full_line, cu_x, cu_y, 
+                            parts.append(f"{sub_key}: {sub_val}")
+                    full_line = line_start + ": " + ", ".join(parts)
+                    cur_y = draw_wrapped_text(full_line, cur_x, cur_y, 
                                               FONT_SIZE_BODY if indent > 0 else FONT_SIZE_TITLE)
                 else:
                     # 하위 카테고리 제목만 출력 후 재귀 호출
-                    cu_y = daw_wapped_text(line_stat, cu_x, cu_y,
+                    cur_y = draw_wrapped_text(line_start, cur_x, cur_y,
                                               FONT_SIZE_BODY if indent > 0 else FONT_SIZE_TITLE)
-                    pocess_section(value, indent + 1)
+                    process_section(value, indent + 1)
             else:
                 # 단순 문자열 데이터
-                full_line = line_stat + ": " + st(value)
-                cu_y = daw_wapped_text(full_line, cu_x, cu_y,
+                full_line = line_start + ": " + str(value)
+                cur_y = draw_wrapped_text(full_line, cur_x, cur_y,
                                           FONT_SIZE_BODY if indent > 0 else FONT_SIZE_TITLE)
-            cu_y -= 3 # 항목 간 미세 간격
+            cur_y -= 3 # 항목 간 미세 간격
 
     # 전체 데이터 순회 시작
-    fo section, content in dse.items():
-        cu_y = check_page_beak(cu_y, 30)
+    for section, content in dse.items():
+        cur_y = check_page_break(cur_y, 30)
+        outline.append((section, c.getPageNumber()))
         c.setLineWidth(0.5)
-        c.line(cu_x, cu_y + 2, cu_x + COL_WIDTH, cu_y + 2) # 섹션 구분선
-        cu_y = daw_wapped_text(f"■ {section}", cu_x, cu_y, FONT_SIZE_TITLE)
-        pocess_section(content, indent=1)
-        cu_y -= 10
+        c.line(cur_x, cur_y + 2, cur_x + COL_WIDTH, cur_y + 2) # 섹션 구분선
+        cur_y = draw_wrapped_text(f"■ {section}", cur_x, cur_y, FONT_SIZE_TITLE)
+        process_section(content, indent=1)
+        cur_y -= 10
+
+    return c.getPageNumber(), outline
+
+# ==========================================
+# 병렬 렌더링: 섹션/항목 범위 단위로 나눠 그린 뒤 합치기
+# ==========================================
+SHARD_SIZE = 2000       # 샤드 하나에 넣을 대략적인 항목 수
+CONTINUED = " (계속)"   # 큰 섹션을 나눴을 때 뒤쪽 조각의 제목
+
+def count_entries(content):
+    """뜻이 있는 항목/문자열 하나를 1로 세는 대략적인 분량"""
+    if not isinstance(content, dict) or "뜻" in content:
+        return 1
+    return max(sum(count_entries(v) for v in content.values()), 1)
+
+def split_content(content, shard_size=SHARD_SIZE):
+    """섹션 내용(dict)을 순서대로 shard_size 안팎의 조각들로 나눈다.
+
+    shard_size보다 큰 하위 분류는 그 안에서 다시 나누고,
+    뒤쪽 조각의 분류 제목에 CONTINUED를 붙인다.
+    한 줄로 합쳐 그려지는 dict(draws_as_line)는 나누면 그리는 방식이 바뀌므로 크더라도 통째로 둔다.
+    """
+    pieces, chunk, chunk_size = [], {}, 0
+    for key, value in content.items():
+        size = count_entries(value)
+        if size > shard_size and isinstance(value, dict) and not draws_as_line(value):
+            if chunk:
+                pieces.append(chunk)
+            chunk, chunk_size = {}, 0
+            for part, sub in enumerate(split_content(value, shard_size)):
+                pieces.append({key + (CONTINUED if part else ""): sub})
+            continue
+        if chunk and chunk_size + size > shard_size:
+            pieces.append(chunk)
+            chunk, chunk_size = {}, 0
+        chunk[key] = value
+        chunk_size += size
+    if chunk:
+        pieces.append(chunk)
+    return pieces
+
+def plan_shards(dse, shard_size=SHARD_SIZE):
+    """섹션 순서를 유지하며 렌더링 단위로 나눈다.
+
+    작은 섹션들은 하나의 샤드로 묶고, shard_size보다 큰 섹션은
+    split_content로 잘라 뒤쪽 조각 제목에 CONTINUED를 붙인다.
+    각 샤드는 새 페이지에서 시작한다.
+    """
+    shards, cur, cur_size = [], {}, 0
 
+    def flush():
+        nonlocal cur, cur_size
+        if cur:
+            shards.append(cur)
+        cur, cur_size = {}, 0
+
+    for section, content in dse.items():
+        size = count_entries(content)
+        if size <= shard_size or not isinstance(content, dict):
+            if cur_size + size > shard_size:
+                flush()
+            cur[section] = content
+            cur_size += size
+            continue
+
+        # 큰 섹션: 하위 분류까지 내려가며 항목 범위 단위로 분할
+        flush()
+        for part, piece in enumerate(split_content(content, shard_size)):
+            shards.append({section + (CONTINUED if part else ""): piece})
+    flush()
+    return shards
+
+def _render_shard(job):
+    """작업 프로세스에서 샤드 하나를 PDF로 그린다"""
+    index, sections, path, pua_font_file, title = job
+    register_fonts(pua_font_file)
+    c = canvas.Canvas(path, pagesize=A4)
+    pages, outline = draw_dictionary(c, sections, title=title)
     c.save()
-    pint(f"✅ 개선 완료: {output_pdf}")
+    return index, path, pages, outline
+
+def _page_number_stamps(path, total):
+    from reportlab.lib.units import mm
+    width, _ = A4
+    c = canvas.Canvas(path, pagesize=A4)
+    for n in range(1, total + 1):
+        c.setFont("Helvetica", 7)
+        c.drawCentredString(width / 2, 12 * mm / 2, f"- {n} -")
+        c.showPage()
+    c.save()
+
+def merge_shards(results, output_pdf):
+    """샤드 PDF를 순서대로 합치고 쪽 번호와 섹션 북마크를 붙인다"""
+    from pypdf import PdfReader, PdfWriter
+
+    writer = PdfWriter()
+    bookmarks = []
+    for _, path, pages, outline in results:
+        offset = len(writer.pages)
+        writer.append(PdfReader(path))
+        for section, page in outline:
+            if not section.endswith(CONTINUED):
+                bookmarks.append((section, offset + page - 1))
+
+    total = len(writer.pages)
+    stamp_path = output_pdf + ".pages.tmp"
+    try:
+        _page_number_stamps(stamp_path, total)
+        stamps = PdfReader(stamp_path)
+        for page, stamp in zip(writer.pages, stamps.pages):
+            page.merge_page(stamp)
+        for section, page in bookmarks:
+            writer.add_outline_item(section, page)
+        with open(output_pdf, "wb") as f:
+            writer.write(f)
+    finally:
+        if os.path.exists(stamp_path):
+            os.remove(stamp_path)
+    return total
+
+def generate_pdf_parallel(json_file, output_pdf, pua_font_file=PUA_FONT_FILE,
+                          workers=None, shard_size=SHARD_SIZE):
+    """generate_pdf_from_json과 같은 항목들을 같은 방식으로 여러 프로세스에서 나눠 그린다.
+
+    다른 점은 두 가지: 샤드마다 새 페이지에서 시작하므로 페이지가 조금 늘 수 있고,
+    나뉜 섹션/분류는 뒤쪽 조각마다 "제목 (계속)" 줄이 한 번 더 나온다.
+    합칠 때 pypdf가 필요하다.
+    """
+    import tempfile
+    from concurrent.futures import ProcessPoolExecutor
+
+    register_fonts(pua_font_file)  # 폰트가 없으면 작업자를 띄우기 전에 실패
+    with open(json_file, "r", encoding="utf-8") as f:
+        dse = json.load(f)
+
+    shards = plan_shards(dse, shard_size)
+    with tempfile.TemporaryDirectory() as tmp:
+        jobs = [
+            (i, sections, os.path.join(tmp, f"shard{i:05d}.pdf"), pua_font_file,
+             "Huiucl Dictionary" if i == 0 else None)
+            for i, sections in enumerate(shards)
+        ]
+        # 큰 샤드부터 넘겨서 마지막에 한 작업자만 남는 상황을 줄임
+        jobs.sort(key=lambda job: -count_entries(job[1]))
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            results = sorted(pool.map(_render_shard, jobs))
+        total = merge_shards(results, output_pdf)
+    print(f"✅ 개선 완료: {output_pdf} (샤드 {len(shards)}개, {total}쪽)")
 
 if __name__ == "__main__":
-    # 유저님의 JSON 파일명에 맞춰 실행
-    json_file = "conlang_pua.json"
-    geneate_pdf_fom_json(json_file, "Huiucl_Impoved.pdf")
\ No newline at end of file
+    import sys
+    from huiucl import main
+    # 예: python PDF.py conlang_pua.json -o Huiucl_Improved.pdf
+    sys.exit(main(["pdf", "--style", "huiucl", *sys.argv[1:]]))
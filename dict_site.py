@@ -0,0 +1,85 @@
+"""사전 JSON → 정적 사이트 (분류별 샤드 + manifest.json)
+
+    python huiucl.py site mizven.json -o site
+
+site/
+    index.html
+    manifest.json           {"categories": [{"name", "count", "parts": [{"html", "json", "rows"}]}]}
+    shards/<해시>.html       미리 그려 둔 <tr> 행들 (바로 표시용)
+    shards/<해시>.json       [단어, 뜻, 경로, 파생여부] 목록 (검색용)
+
+샤드 파일 이름은 내용의 해시라서, 다른 분류를 고쳐도 바뀌지 않은 샤드는
+브라우저 캐시에 그대로 남는다. 매번 새로 받는 것은 작은 manifest.json 뿐이다.
+
+index.html은 검색어가 없으면 HTML 샤드를 몇 개씩만 붙이고 나머지는 '더 보기'로 받는다 ('모두' 포함).
+검색하면 보고 있는 분류의 JSON 샤드를 전부 받는다. '모두'에서 검색하면 사전 전체를 받는 셈이다.
+"""
+import hashlib
+import html
+import json
+import os
+import shutil
+
+from lexicon import iter_entries, load_lexicon
+
+ROWS_PER_PART = 500     # 샤드 하나에 넣을 행 수 (첫 행까지의 시간을 일정하게 유지)
+SHARD_DIR = "shards"
+MANIFEST = "manifest.json"
+PAGE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "index.html")
+
+def render_rows(rows):
+    out = []
+    for word, meaning, path, derived in rows:
+        out.append(
+            f'<tr><td class="word-cell">{"↳ " if derived else ""}{html.escape(word)}</td>'
+            f"<td>{html.escape(meaning)}</td>"
+            f'<td style="font-size:0.7em; color:#ccc;">{html.escape(path)}</td></tr>'
+        )
+    return "\n".join(out)
+
+def write_shard(out_dir, text, ext):
+    """내용 해시로 이름을 붙여 저장하고 manifest에 넣을 상대 경로를 돌려준다"""
+    data = text.encode("utf-8")
+    name = f"{SHARD_DIR}/{hashlib.sha256(data).hexdigest()[:16]}.{ext}"
+    path = os.path.join(out_dir, name)
+    if not os.path.exists(path):  # 같은 이름이면 같은 내용
+        with open(path, "wb") as f:
+            f.write(data)
+    return name
+
+def build_site(lexicon, out_dir="site", rows_per_part=ROWS_PER_PART, page=PAGE, prune=True):
+    if rows_per_part < 1:
+        raise ValueError(f"rows_per_part는 1 이상이어야 합니다: {rows_per_part}")
+    dse = load_lexicon(lexicon)
+    os.makedirs(os.path.join(out_dir, SHARD_DIR), exist_ok=True)
+
+    categories = []
+    for category, content in dse.items():
+        if category == "설정" or not isinstance(content, dict): continue
+        rows = [(w, m, p, 1 if d else 0) for w, m, p, d in iter_entries(content, category)]
+        parts = []
+        for i in range(0, len(rows), rows_per_part):
+            chunk = rows[i:i + rows_per_part]
+            parts.append({
+                "html": write_shard(out_dir, render_rows(chunk), "html"),
+                "json": write_shard(out_dir, json.dumps(chunk, ensure_ascii=False), "json"),
+                "rows": len(chunk),
+            })
+        categories.append({"name": category, "count": len(rows), "parts": parts})
+
+    manifest = {"source": os.path.basename(lexicon), "categories": categories}
+    with open(os.path.join(out_dir, MANIFEST), "w", encoding="utf-8") as f:
+        json.dump(manifest, f, ensure_ascii=False, indent=1)
+    if os.path.exists(page):
+        shutil.copyfile(page, os.path.join(out_dir, "index.html"))
+
+    if prune:
+        used = {os.path.basename(p[k]) for c in categories for p in c["parts"] for k in ("html", "json")}
+        for name in os.listdir(os.path.join(out_dir, SHARD_DIR)):
+            if name not in used:
+                os.remove(os.path.join(out_dir, SHARD_DIR, name))
+
+    total = sum(c["count"] for c in categories)
+    shards = sum(len(c["parts"]) for c in categories)
+    print(f"✅ {out_dir}: 분류 {len(categories)}개, 항목 {total}개, 샤드 {shards}쌍")
+    return manifest
@@ -0,0 +1,230 @@
+"""create_ttf 벤치마크 / 회귀 검사 (GUI 없이)
+
+    python huiucl.py bench-font -o bench_font.json
+    python huiucl.py bench-font --compare 이전결과.json
+    python huiucl.py bench-font --update-golden      # 모양을 일부러 바꿨을 때만
+
+합성 획(glyph_store.synthetic_glyphs, 곡선 모양 VOCABULARY가지를 돌려 씀)을 ttf_scaling.py(폰트.py)와 ttf_linked.py(폰트1.py)의
+create_ttf로 각각 컴파일해서 컴파일 시간, 최대 메모리, TTF 크기, 글자당 점/윤곽 수,
+scaling의 획 윤곽 캐시 적중률을 잰다. --cache-size 0 이면 캐시 없이 잰다.
+캐시를 쓰지 않는 파이프라인(linked, glyph_io.CACHED_PIPELINES 밖)과 캐시 없는 측정은 적중률을 null로 남긴다.
+
+회귀 검사는 font_bench_golden.json과 비교한다.
+  glyf    GLYF_SETS의 합성 글꼴을 기본(캐시 없이)과 캐시를 켠 채(scaling) 컴파일해서 글자마다 윤곽 좌표/끝점/너비의 해시가
+          기준과 정확히 같아야 한다 (한 점이라도 움직이면 실패).
+  raster  음소 10자 세트를 저해상도로 래스터화한 픽셀 차이 (보조 지표, 어디가 얼마나 바뀌었는지 보기용)
+"""
+import base64
+import hashlib
+import json
+import os
+import platform
+import statistics
+import tempfile
+import time
+import tracemalloc
+
+from glyph_store import synthetic_glyphs
+from glyph_io import CACHED_PIPELINES, TTF_PIPELINES as PIPELINES
+from stroke_cache import MAXSIZE, StrokeCache
+
+SIZES = (10, 100, 1000, 4000)
+VOCABULARY = 64             # 합성 글꼴의 곡선 모양 가짓수 (기준 래스터 세트는 제외)
+GOLDEN_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "font_bench_golden.json")
+GOLDEN_SIZE = 10            # PHONEME_LIST와 같은 글자 수
+RASTER_SCALE = 32           # 폰트 단위 32 → 1픽셀
+RASTER_BOX = (0, -256, 2048, 1280)   # 두 파이프라인의 글자가 모두 들어가는 영역
+RASTER_TOLERANCE = 0.02     # 글자별 허용 픽셀 차이 비율
+GLYF_SIZE = 500
+GLYF_SETS = {"plain": None, "vocabulary": VOCABULARY}   # 정확 비교용 합성 글꼴 (곡선 모양 가짓수)
+
+def load_pipeline(name):
+    return __import__(PIPELINES[name])
+
+def new_cache(pipeline, cache_size):
+    """캐시를 받는 파이프라인이면 새 StrokeCache, 아니면 (또는 cache_size=0이면) None"""
+    return StrokeCache(cache_size) if pipeline in CACHED_PIPELINES and cache_size else None
+
+def build(pipeline, path, glyphs, cache=None):
+    create_ttf = load_pipeline(pipeline).create_ttf
+    if cache is None: create_ttf(path, glyphs)
+    else: create_ttf(path, glyphs, cache=cache)
+
+def compile_font(pipeline, glyphs, path, memory=True, cache_size=MAXSIZE):
+    """(컴파일 시간, 최대 메모리 바이트, 캐시 적중률 또는 None). 시간은 tracemalloc 없이 따로 잰다"""
+    cache = new_cache(pipeline, cache_size)
+    start = time.perf_counter()
+    build(pipeline, path, glyphs, cache)
+    elapsed = time.perf_counter() - start
+    peak = None
+    if memory:
+        tracemalloc.start()
+        build(pipeline, path, glyphs, new_cache(pipeline, cache_size))
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+    return elapsed, peak, cache.hit_rate if cache is not None else None
+
+def _summary(values):
+    return {"mean": round(statistics.fmean(values), 2), "max": max(values)} if values else {"mean": 0, "max": 0}
+
+def glyph_stats(path):
+    from fontTools.ttLib import TTFont
+    font = TTFont(path)
+    glyf = font["glyf"]
+    points, contours = [], []
+    for name in font.getGlyphOrder():
+        if name == ".notdef": continue
+        g = glyf[name]
+        contours.append(max(g.numberOfContours, 0))
+        points.append(len(g.getCoordinates(glyf)[0]) if g.numberOfContours > 0 else 0)
+    return {"points_per_glyph": _summary(points), "contours_per_glyph": _summary(contours)}
+
+def rasterize(path):
+    """{글자 이름: 1비트 비트맵 bytes}. 모든 윤곽이 직선이라 다각형 채우기로 충분하다"""
+    from fontTools.ttLib import TTFont
+    from PIL import Image, ImageDraw
+
+    x0, y0, x1, y1 = RASTER_BOX
+    size = ((x1 - x0) // RASTER_SCALE, (y1 - y0) // RASTER_SCALE)
+    font = TTFont(path)
+    glyf = font["glyf"]
+    out = {}
+    for name in font.getGlyphOrder():
+        if name == ".notdef": continue
+        img = Image.new("1", size, 0)
+        draw = ImageDraw.Draw(img)
+        g = glyf[name]
+        if g.numberOfContours > 0:
+            coords, ends, _ = g.getCoordinates(glyf)
+            start = 0
+            for end in ends:
+                poly = [((x - x0) / RASTER_SCALE, (y1 - y) / RASTER_SCALE) for x, y in coords[start:end + 1]]
+                if len(poly) > 2:
+                    draw.polygon(poly, fill=1)
+                start = end + 1
+        out[name] = img.tobytes()
+    return out
+
+def glyph_digests(path):
+    """글자 순서대로 (좌표, 끝점, 곡선 위 여부, 가로 너비)의 해시"""
+    from fontTools.ttLib import TTFont
+    font = TTFont(path)
+    glyf, hmtx = font["glyf"], font["hmtx"]
+    out = []
+    for name in font.getGlyphOrder():
+        if name == ".notdef": continue
+        g = glyf[name]
+        h = hashlib.sha256(repr(hmtx[name]).encode("ascii"))
+        if g.numberOfContours > 0:
+            coords, ends, flags = g.getCoordinates(glyf)
+            h.update(repr([(int(x), int(y)) for x, y in coords]).encode("ascii"))
+            h.update(repr(list(ends)).encode("ascii"))
+            h.update(bytes(f & 1 for f in flags))
+        out.append(h.hexdigest()[:16])
+    return out
+
+def glyf_sets():
+    for name, vocabulary in GLYF_SETS.items():
+        yield name, synthetic_glyphs(GLYF_SIZE, vocabulary=vocabulary)
+
+def check_glyf(pipeline, tmp, golden, cache_size=MAXSIZE):
+    """create_ttf 출력이 기준 glyf와 글자마다 정확히 같은지. 캐시를 받는 파이프라인은 캐시를 켠 출력도 본다"""
+    expected = golden.get("glyf", {}).get(pipeline, {})
+    checked, failed = 0, []
+    for name, glyphs in glyf_sets():
+        want = expected.get(name, "").split()
+        for mode, cache in (("", None), ("cache:", new_cache(pipeline, cache_size))):
+            if mode and cache is None: continue
+            path = os.path.join(tmp, f"{pipeline}-glyf-{name}.ttf")
+            build(pipeline, path, glyphs, cache)
+            for code, got, ref in zip(glyphs, glyph_digests(path), want + [None] * len(glyphs)):
+                checked += 1
+                if got != ref:
+                    failed.append(f"{mode}{name}:uni{code:04X}")
+    return {"checked": checked, "failed": failed}
+
+def raster_diff(a, b):
+    """두 비트맵에서 다른 픽셀 수 / 칠해진 픽셀 수"""
+    ia, ib = int.from_bytes(a, "big"), int.from_bytes(b, "big")
+    return bin(ia ^ ib).count("1") / max(bin(ia | ib).count("1"), 1)
+
+def check_raster(pipeline, path, golden):
+    expected = golden.get("raster", {}).get(pipeline, {})
+    actual = rasterize(path)
+    diffs = {
+        name: raster_diff(bitmap, base64.b64decode(expected[name])) if name in expected else 1.0
+        for name, bitmap in actual.items()
+    }
+    failed = sorted(name for name, d in diffs.items() if d > RASTER_TOLERANCE)
+    return {"checked": len(diffs), "max_diff": round(max(diffs.values(), default=0), 4), "failed": failed}
+
+def update_golden(pipelines=PIPELINES):
+    golden = {"glyf": {}, "raster": {}}
+    glyphs = synthetic_glyphs(GOLDEN_SIZE)
+    with tempfile.TemporaryDirectory() as tmp:
+        for pipeline in pipelines:
+            path = os.path.join(tmp, f"{pipeline}.ttf")
+            build(pipeline, path, glyphs)
+            golden["raster"][pipeline] = {name: base64.b64encode(bits).decode("ascii")
+                                          for name, bits in rasterize(path).items()}
+            golden["glyf"][pipeline] = {}
+            for name, font_glyphs in glyf_sets():
+                build(pipeline, path, font_glyphs)
+                golden["glyf"][pipeline][name] = " ".join(glyph_digests(path))
+    with open(GOLDEN_FILE, "w", encoding="utf-8") as f:
+        json.dump(golden, f, indent=1, sort_keys=True)
+    print(f"✅ 기준 glyf/래스터 갱신: {GOLDEN_FILE}")
+
+def run(sizes=SIZES, pipelines=PIPELINES, memory=True, cache_size=MAXSIZE, vocabulary=VOCABULARY):
+    import fontTools
+
+    with open(GOLDEN_FILE, "r", encoding="utf-8") as f:
+        golden = json.load(f)
+
+    report = {
+        "python": platform.python_version(),
+        "fonttools": fontTools.version,
+        "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "cache_size": cache_size,
+        "vocabulary": vocabulary,
+        "results": [],
+        "raster": {},
+        "glyf": {},
+    }
+    with tempfile.TemporaryDirectory() as tmp:
+        for size in sizes:
+            golden_set = size == GOLDEN_SIZE
+            glyphs = synthetic_glyphs(size, vocabulary=None if golden_set else vocabulary)
+            for pipeline in pipelines:
+                path = os.path.join(tmp, f"{pipeline}-{size}.ttf")
+                elapsed, peak, hit_rate = compile_font(pipeline, glyphs, path, memory, cache_size)
+                row = {
+                    "pipeline": pipeline,
+                    "glyphs": size,
+                    "compile_s": round(elapsed, 4),
+                    "peak_kib": round(peak / 1024) if peak is not None else None,
+                    "ttf_bytes": os.path.getsize(path),
+                    "cache_hit_rate": round(hit_rate, 4) if hit_rate is not None else None,
+                    **glyph_stats(path),
+                }
+                report["results"].append(row)
+                print(f"{pipeline:>8} {size:>6}자  {elapsed:7.3f}s  "
+                      f"{row['ttf_bytes'] / 1024:8.1f}KiB  점 {row['points_per_glyph']['mean']:.0f}/자  "
+                      + (f"캐시 적중 {hit_rate:.0%}" if hit_rate is not None else "캐시 없음"))
+                if golden_set:
+                    report["raster"][pipeline] = check_raster(pipeline, path, golden)
+        for pipeline in pipelines:
+            report["glyf"][pipeline] = check_glyf(pipeline, tmp, golden, cache_size)
+    return report
+
+def compare(old, new):
+    """같은 (파이프라인, 글자 수) 항목끼리 새/이전 비율을 출력"""
+    before = {(r["pipeline"], r["glyphs"]): r for r in old["results"]}
+    for r in new["results"]:
+        o = before.get((r["pipeline"], r["glyphs"]))
+        if not o: continue
+        parts = []
+        for key in ("compile_s", "peak_kib", "ttf_bytes"):
+            if o.get(key) and r.get(key) is not None:
+                parts.append(f"{key} x{r[key] / o[key]:.2f}")
+        print(f"{r['pipeline']:>8} {r['glyphs']:>6}자  " + ", ".join(parts))
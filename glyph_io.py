@@ -0,0 +1,38 @@
+"""글자 획 파일 입출력 - 표준 라이브러리만 사용 (편집기, huiucl.py, font_bench.py가 같이 쓴다)
+
+    conlang_PUA.glyphs.json   {"E000": {"curves": [[x1, y1, cx, cy, x2, y2]], "dots": [[x, y, r]]}}
+    *.hgs                     GlyphStore 배열 그대로 (glyph_store.py)
+"""
+import json
+
+GLYPHS_FILE = "conlang_PUA.glyphs.json"
+TTF_PIPELINES = {"scaling": "ttf_scaling", "linked": "ttf_linked"}   # 편집기 변형 → PyQt6 없는 create_ttf 모듈
+CACHED_PIPELINES = ("scaling",)   # create_ttf(cache=StrokeCache)를 받는 파이프라인
+
+
+def save_glyphs(path, glyphs):
+    """편집기의 glyphs({코드포인트: {"curves", "dots"}})를 저장. .hgs면 배열 그대로, 아니면 JSON"""
+    if path.endswith(".hgs"):
+        from glyph_store import GlyphStore
+        store = glyphs if isinstance(glyphs, GlyphStore) else GlyphStore.from_dict(glyphs)
+        store.save(path)
+        return
+    out = {
+        f"{code:04X}": {"curves": [list(c) for c in strokes["curves"]],
+                        "dots": [list(d) for d in strokes["dots"]]}
+        for code, strokes in glyphs.items()
+    }
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(out, f, ensure_ascii=False)
+
+def load_glyphs(path):
+    """save_glyphs로 저장한 파일을 GlyphStore로 읽는다"""
+    from glyph_store import GlyphStore
+    if path.endswith(".hgs"):
+        return GlyphStore.load(path)
+    with open(path, "r", encoding="utf-8") as f:
+        raw = json.load(f)
+    return GlyphStore.from_dict({
+        int(code, 16): {"curves": strokes.get("curves", []), "dots": strokes.get("dots", [])}
+        for code, strokes in raw.items()
+    })
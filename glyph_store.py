@@ -0,0 +1,187 @@
+"""글자 획 저장소 - PUA 전체(0xE000-0xF8FF)를 담을 수 있는 배열 기반 구조
+
+편집기의 glyphs 딕셔너리({코드: {"curves": [(x1, y1, cx, cy, x2, y2)], "dots": [(x, y, r)]}})와
+같은 모양으로 읽히지만, 실제 값은 연속된 float 배열 두 개에 들어 있다.
+
+    curves   [x1 y1 cx cy x2 y2 | x1 y1 ...]     곡선당 6개
+    dots     [x y r | x y r | ...]              점당 3개
+    codes    [0xE000, 0xE001, ...]              오름차순 코드포인트
+    curve_off / dot_off                         codes[i]의 획은 off[i]:off[i+1] (곡선/점 단위)
+
+순회하면 (x1, y1, ...) 튜플이 나오지만 zip이 같은 튜플을 다시 쓰므로 곡선마다 객체가 쌓이지 않는다.
+create_ttf는 경계 상자를 flat()의 간격 슬라이스로 바로 구한다.
+flat()과 순회는 글자 구간을 복사한 배열을 쓰므로 (memoryview 아님) 보기가 살아 있어도
+add()/set()으로 배열을 늘릴 수 있다.
+"""
+import random
+import struct
+import sys
+from array import array
+from bisect import bisect_left
+
+PUA_START = 0xE000
+PUA_END = 0xF8FF
+CURVE_LEN = 6
+DOT_LEN = 3
+
+MAGIC = b"HGS1"
+_HEADER = struct.Struct("<4sIII")   # 매직, 글자 수, 곡선 수, 점 수
+
+
+class _Strokes:
+    """배열 구간을 (x1, y1, ...) 튜플처럼 순회하게 해 주는 얇은 보기"""
+    __slots__ = ("data", "start", "stop", "step")
+
+    def __init__(self, data, start, stop, step):
+        self.data, self.start, self.stop, self.step = data, start, stop, step
+
+    def __len__(self):
+        return (self.stop - self.start) // self.step
+
+    def __iter__(self):
+        it = iter(self.flat())
+        return zip(*[it] * self.step)
+
+    def __bool__(self):
+        return self.stop > self.start
+
+    def flat(self):
+        """구간을 array로 복사해 돌려준다. memoryview로 빌려 주면 원본 배열을 늘릴 수 없게 되므로"""
+        return self.data[self.start:self.stop]
+
+
+class GlyphStore:
+    def __init__(self):
+        self.codes = array("I")
+        self.curve_off = array("I", [0])
+        self.dot_off = array("I", [0])
+        self.curves = array("f")
+        self.dots = array("f")
+
+    @classmethod
+    def from_dict(cls, glyphs):
+        store = cls()
+        for code in sorted(glyphs):
+            strokes = glyphs[code]
+            store.add(code, strokes.get("curves", ()), strokes.get("dots", ()))
+        return store
+
+    # --- 쓰기 ---
+    def add(self, code, curves, dots):
+        """code가 지금까지의 최댓값보다 클 때 뒤에 붙인다 (편집기는 항상 이 경우)"""
+        if self.codes and code <= self.codes[-1]:
+            raise ValueError(f"U+{code:04X}: 코드포인트는 오름차순으로 추가해야 합니다 (set 사용)")
+        for c in curves: self.curves.extend(c)
+        for d in dots: self.dots.extend(d)
+        self.codes.append(code)
+        self.curve_off.append(len(self.curves) // CURVE_LEN)
+        self.dot_off.append(len(self.dots) // DOT_LEN)
+
+    def set(self, code, curves, dots):
+        """추가 또는 교체. 중간 교체는 배열을 다시 만든다 (O(전체))"""
+        if not self.codes or code > self.codes[-1]:
+            self.add(code, curves, dots)
+            return
+        glyphs = {c: self[c] for c in self.codes}
+        glyphs[code] = {"curves": list(curves), "dots": list(dots)}
+        self.__dict__.update(GlyphStore.from_dict(glyphs).__dict__)
+
+    # --- 읽기 (dict처럼) ---
+    def _index(self, code):
+        i = bisect_left(self.codes, code)
+        if i == len(self.codes) or self.codes[i] != code:
+            raise KeyError(code)
+        return i
+
+    def __len__(self):
+        return len(self.codes)
+
+    def __contains__(self, code):
+        try:
+            self._index(code)
+        except KeyError:
+            return False
+        return True
+
+    def __iter__(self):
+        return iter(self.codes)
+
+    def __getitem__(self, code):
+        i = self._index(code)
+        return {
+            "curves": _Strokes(self.curves, self.curve_off[i] * CURVE_LEN,
+                               self.curve_off[i + 1] * CURVE_LEN, CURVE_LEN),
+            "dots": _Strokes(self.dots, self.dot_off[i] * DOT_LEN,
+                             self.dot_off[i + 1] * DOT_LEN, DOT_LEN),
+        }
+
+    def items(self):
+        for code in self.codes:
+            yield code, self[code]
+
+    def nbytes(self):
+        arrays = (self.codes, self.curve_off, self.dot_off, self.curves, self.dots)
+        return sum(a.itemsize * len(a) for a in arrays)
+
+    # --- 파일 ---
+    def save(self, path):
+        arrays = (self.codes, self.curve_off, self.dot_off, self.curves, self.dots)
+        with open(path, "wb") as f:
+            f.write(_HEADER.pack(MAGIC, len(self.codes), len(self.curves) // CURVE_LEN,
+                                 len(self.dots) // DOT_LEN))
+            for a in arrays:
+                if sys.byteorder == "big":
+                    a = array(a.typecode, a); a.byteswap()
+                a.tofile(f)
+
+    @classmethod
+    def load(cls, path):
+        store = cls()
+        with open(path, "rb") as f:
+            magic, n, n_curves, n_dots = _HEADER.unpack(f.read(_HEADER.size))
+            if magic != MAGIC:
+                raise ValueError(f"{path}: 글자 저장소 파일이 아닙니다.")
+            store.curve_off, store.dot_off = array("I"), array("I")
+            for a, count in ((store.codes, n), (store.curve_off, n + 1), (store.dot_off, n + 1),
+                             (store.curves, n_curves * CURVE_LEN), (store.dots, n_dots * DOT_LEN)):
+                a.fromfile(f, count)
+                if sys.byteorder == "big": a.byteswap()
+        return store
+
+
+def synthetic_glyphs(count=PUA_END - PUA_START + 1, curves=4, dots=1, grid=50, canvas=600, seed=0,
+                     vocabulary=None):
+    """편집기 격자에 맞춘 가짜 획으로 채운 딕셔너리 (벤치마크용)
+
+    vocabulary=N이면 곡선 모양(p1 기준 cp, p2)을 N가지로 정해 두고 위치만 바꿔 쓴다.
+    실제 문자처럼 같은 획이 되풀이되는 경우를 흉내 낸다.
+    """
+    rng = random.Random(seed)
+    cells = canvas // grid
+
+    def pt():
+        return float(rng.randint(1, cells - 1) * grid), float(rng.randint(1, cells - 1) * grid)
+
+    shapes = []
+    for _ in range(vocabulary or 0):
+        (x1, y1), (cx, cy), (x2, y2) = pt(), pt(), pt()
+        shapes.append((cx - x1, cy - y1, x2 - x1, y2 - y1))
+
+    def curve():
+        if not shapes:
+            return (*pt(), *pt(), *pt())
+        dcx, dcy, dx2, dy2 = rng.choice(shapes)
+        # 세 점이 모두 캔버스 안에 들어가는 p1 범위
+        lo_x, hi_x = grid - min(0, dcx, dx2), canvas - grid - max(0, dcx, dx2)
+        lo_y, hi_y = grid - min(0, dcy, dy2), canvas - grid - max(0, dcy, dy2)
+        x1 = float(rng.randint(int(lo_x // grid), int(hi_x // grid)) * grid)
+        y1 = float(rng.randint(int(lo_y // grid), int(hi_y // grid)) * grid)
+        return (x1, y1, x1 + dcx, y1 + dcy, x1 + dx2, y1 + dy2)
+
+    glyphs = {}
+    for code in range(PUA_START, PUA_START + count):
+        glyphs[code] = {
+            "curves": [curve() for _ in range(rng.randint(1, curves))],
+            "dots": [(*pt(), 12.0) for _ in range(rng.randint(0, dots))],
+        }
+    return glyphs
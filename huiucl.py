@@ -0,0 +1,373 @@
+"""Huiucl 통합 명령줄 도구
+
+    python huiucl.py pdf Ehn.json -o Huiucl_Standard_Font.pdf
+    python huiucl.py pdf Venirwa.json --style venirwa
+    python huiucl.py font --variant linked
+    python huiucl.py export conlang_PUA.glyphs.json -o conlang_PUA.ttf   (.hgs도 가능)
+    python huiucl.py site mizven.json -o site
+    python huiucl.py validate *.json
+    python huiucl.py lookup Ehn.json 나
+    python huiucl.py pdf Ehn.json -j 0          # CPU 수만큼 병렬 렌더링
+    python huiucl.py bench-pdf --entries 100000
+    python huiucl.py bench-glyphs
+    python huiucl.py bench-font --compare 이전결과.json
+    python huiucl.py bench-startup
+
+reportlab / fontTools / PyQt6는 해당 하위 명령을 실행할 때만 import 한다.
+이 모듈의 최상위에는 표준 라이브러리만 둘 것 (bench-startup이 확인한다).
+"""
+import argparse
+import json
+import os
+import sys
+
+from glyph_io import CACHED_PIPELINES, GLYPHS_FILE, TTF_PIPELINES, load_glyphs, save_glyphs
+from lexicon import iter_entries, load_lexicon
+
+HEAVY_MODULES = ("reportlab", "fontTools", "PyQt6")
+PDF_STYLES = {"huiucl": "PDF", "venirwa": "이거"}
+FONT_VARIANTS = {"scaling": "폰트", "linked": "폰트1"}
+
+
+# ==========================================
+# 하위 명령
+# ==========================================
+def cmd_pdf(args):
+    # 이거.py는 사전이 없으면 메시지만 출력하고 돌아오므로 여기서 먼저 확인
+    if not os.path.exists(args.lexicon):
+        print(f"❌ {args.lexicon}: 파일을 찾을 수 없습니다.")
+        return 1
+    # 무거운 의존성은 여기서 처음 import 됨
+    module = __import__(PDF_STYLES[args.style])
+    output = args.output or os.path.splitext(os.path.basename(args.lexicon))[0] + ".pdf"
+    if args.style == "huiucl" and args.jobs != 1:
+        module.generate_pdf_parallel(args.lexicon, output, pua_font_file=args.pua_font,
+                                     workers=args.jobs or None, shard_size=args.shard_size)
+    elif args.style == "huiucl":
+        module.generate_pdf_from_json(args.lexicon, output, pua_font_file=args.pua_font)
+    else:
+        module.generate_pdf_from_json(args.lexicon, output)
+    return 0
+
+def cmd_font(args):
+    module = __import__(FONT_VARIANTS[args.variant])
+    from PyQt6.QtWidgets import QApplication
+    app = QApplication(sys.argv[:1])
+    w = module.MainWindow(); w.show()
+    return app.exec()
+
+def cmd_export(args):
+    if args.stroke_cache and args.variant not in CACHED_PIPELINES:
+        print(f"❌ --stroke-cache는 {', '.join(CACHED_PIPELINES)} 변형에서만 쓸 수 있습니다 ({args.variant}는 캐시 없음).")
+        return 2
+    module = __import__(TTF_PIPELINES[args.variant])
+    glyphs = load_glyphs(args.glyphs)
+    if not args.stroke_cache:
+        module.create_ttf(args.output, glyphs)
+        print(f"✅ {len(glyphs)}개 글자 → {args.output}")
+        return 0
+    from stroke_cache import StrokeCache
+    cache = StrokeCache(args.cache_size, path=args.stroke_cache)
+    module.create_ttf(args.output, glyphs, cache=cache)
+    cache.save()
+    print(f"✅ {len(glyphs)}개 글자 → {args.output}")
+    print(cache.stats())
+    return 0
+
+def cmd_site(args):
+    import dict_site
+    dict_site.build_site(args.lexicon, args.output, rows_per_part=args.rows_per_part)
+    return 0
+
+def cmd_validate(args):
+    failed = 0
+    for path in args.lexicons:
+        try:
+            data = load_lexicon(path)
+        except FileNotFoundError:
+            print(f"❌ {path}: 파일을 찾을 수 없습니다.")
+            failed += 1
+            continue
+        except json.JSONDecodeError as e:
+            print(f"❌ {path}:{e.lineno}:{e.colno}: {e.msg}")
+            failed += 1
+            continue
+        if not isinstance(data, dict):
+            print(f"❌ {path}: 최상위는 객체여야 합니다.")
+            failed += 1
+            continue
+        count = sum(1 for _ in iter_entries(data))
+        print(f"✅ {path}: 섹션 {len(data)}개, 항목 {count}개")
+    return 1 if failed else 0
+
+def cmd_lookup(args):
+    query = args.query.lower()
+    found = 0
+    for word, meaning, path, derived in iter_entries(load_lexicon(args.lexicon)):
+        if query in word.lower() or query in meaning.lower():
+            print(f"{'↳ ' if derived else ''}{word}\t{meaning}\t{path}")
+            found += 1
+    return 0 if found else 1
+
+def synthetic_lexicon(entries, sections=8, group_size=500):
+    """벤치마크용 가짜 사전: 섹션마다 하위 분류(group_size개씩)를 두고 뜻/파생이 섞인 항목을 채운다
+
+    항목은 모두 {"뜻": ...} 형태라서 분류는 제목으로, 항목은 한 줄씩 그려진다
+    (분류 안에 문자열 값이 있으면 PDF.py가 분류 전체를 한 줄로 합쳐 그리고 나누지 않는다).
+    """
+    data = {}
+    per_section = max(entries // sections, 1)
+    for s in range(sections):
+        section = data.setdefault(f"섹션{s}", {})
+        for i in range(per_section):
+            group = section.setdefault(f"분류{i // group_size}", {})
+            word = f"w{s}x{i}"
+            if i % 4 == 0:
+                group[word] = {"뜻": f"뜻풀이 {i} 번째 항목", "파생": {word + "a": "파생된 뜻"}}
+            else:
+                group[word] = {"뜻": f"단어 {i}의 짧은 뜻"}
+    return data
+
+def cmd_bench_pdf(args):
+    """합성 사전으로 단일 캔버스 대 병렬 샤드 렌더링의 벽시계 시간을 잰다"""
+    import tempfile
+    import time
+    import PDF
+
+    jobs = args.jobs or [1, 2, 4, os.cpu_count() or 1]
+    jobs = sorted(set(jobs))
+    with tempfile.TemporaryDirectory() as tmp:
+        lexicon = os.path.join(tmp, "bench.json")
+        with open(lexicon, "w", encoding="utf-8") as f:
+            json.dump(synthetic_lexicon(args.entries, args.sections, args.group_size), f, ensure_ascii=False)
+
+        timings = {}
+        start = time.perf_counter()
+        PDF.generate_pdf_from_json(lexicon, os.path.join(tmp, "serial.pdf"), args.pua_font)
+        timings["serial"] = time.perf_counter() - start
+        for n in jobs:
+            start = time.perf_counter()
+            PDF.generate_pdf_parallel(lexicon, os.path.join(tmp, f"jobs{n}.pdf"), args.pua_font,
+                                      workers=n, shard_size=args.shard_size)
+            timings[f"jobs={n}"] = time.perf_counter() - start
+
+    print(f"항목 {args.entries}개, CPU {os.cpu_count()}개")
+    for name, sec in timings.items():
+        print(f"{name:>10}: {sec:8.2f} s  (x{timings['serial'] / sec:.2f})")
+    return 0
+
+def cmd_bench_glyphs(args):
+    """PUA 전체를 채운 합성 글꼴로 딕셔너리 방식과 GlyphStore의 메모리/로드 시간을 비교"""
+    import tempfile
+    import time
+    import tracemalloc
+    from glyph_store import GlyphStore, synthetic_glyphs
+
+    def measure(build):
+        tracemalloc.start()
+        start = time.perf_counter()
+        result = build()
+        elapsed = time.perf_counter() - start
+        current, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        return result, elapsed, current, peak
+
+    source = synthetic_glyphs(args.glyphs, curves=args.curves, dots=args.dots)
+    with tempfile.TemporaryDirectory() as tmp:
+        json_path = os.path.join(tmp, "glyphs.json")
+        hgs_path = os.path.join(tmp, "glyphs.hgs")
+        save_glyphs(json_path, source)
+        save_glyphs(hgs_path, source)
+
+        def load_dict():
+            with open(json_path, "r", encoding="utf-8") as f:
+                raw = json.load(f)
+            return {int(k, 16): {"curves": [tuple(c) for c in v["curves"]],
+                                 "dots": [tuple(d) for d in v["dots"]]} for k, v in raw.items()}
+
+        rows = [
+            ("dict (JSON)", *measure(load_dict)[1:]),
+            ("GlyphStore (JSON)", *measure(lambda: load_glyphs(json_path))[1:]),
+            ("GlyphStore (.hgs)", *measure(lambda: GlyphStore.load(hgs_path))[1:]),
+        ]
+        sizes = {"JSON": os.path.getsize(json_path), ".hgs": os.path.getsize(hgs_path)}
+
+    store = GlyphStore.from_dict(source)
+    print(f"글자 {len(store)}개, 곡선 {len(store.curves) // 6}개, 점 {len(store.dots) // 3}개")
+    print(f"파일 크기: JSON {sizes['JSON'] / 1024:.0f} KiB, .hgs {sizes['.hgs'] / 1024:.0f} KiB")
+    print(f"{'':>18}  {'로드':>8}  {'상주 메모리':>10}  {'최대 메모리':>10}")
+    for name, sec, current, peak in rows:
+        print(f"{name:>18}  {sec * 1000:6.1f}ms  {current / 1024:8.0f}KiB  {peak / 1024:8.0f}KiB")
+    return 0
+
+def cmd_bench_font(args):
+    import font_bench
+    if args.update_golden:
+        font_bench.update_golden(args.pipelines)
+        return 0
+    report = font_bench.run(args.sizes, args.pipelines, memory=not args.no_memory,
+                            cache_size=args.cache_size, vocabulary=args.vocabulary)
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump(report, f, ensure_ascii=False, indent=1)
+    print(f"✅ 결과 저장: {args.output}")
+    if args.compare:
+        with open(args.compare, "r", encoding="utf-8") as f:
+            font_bench.compare(json.load(f), report)
+    failed = 0
+    for pipeline, result in report["glyf"].items():
+        if result["failed"]:
+            names = result["failed"]
+            print(f"❌ {pipeline}: 기준 glyf와 다른 글자 {len(names)}/{result['checked']}개 "
+                  f"({', '.join(names[:10])}{' ...' if len(names) > 10 else ''})")
+            failed += 1
+        else:
+            print(f"✅ {pipeline}: glyf {result['checked']}자 기준과 같음")
+    for pipeline, result in report["raster"].items():
+        if result["failed"]:
+            print(f"❌ {pipeline}: 기준 래스터와 다른 글자 {', '.join(result['failed'])}")
+            failed += 1
+    return 1 if failed else 0
+
+def cmd_bench_startup(args):
+    """이 모듈의 import 시간과 --help 실행 시간을 측정하고 무거운 import가 없는지 확인"""
+    import subprocess
+    import time
+
+    here = os.path.dirname(os.path.abspath(__file__))
+    probe = (
+        "import sys, huiucl; "
+        f"print(','.join(m for m in {HEAVY_MODULES!r} if m in sys.modules))"
+    )
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", probe],
+        cwd=here, capture_output=True, text=True, check=True,
+    )
+    leaked = proc.stdout.strip()
+    import_us = 0
+    for line in proc.stderr.splitlines():
+        # "import time: self [us] | cumulative | imported package"
+        parts = line.split("|")
+        if len(parts) == 3 and parts[2].strip() == "huiucl":
+            import_us = int(parts[1])
+
+    samples = []
+    for _ in range(args.runs):
+        start = time.perf_counter()
+        subprocess.run([sys.executable, os.path.join(here, "huiucl.py"), "--help"],
+                       cwd=here, capture_output=True, check=True)
+        samples.append((time.perf_counter() - start) * 1000)
+    samples.sort()
+    help_ms = samples[len(samples) // 2]
+
+    print(f"import huiucl: {import_us / 1000:.2f} ms (누적)")
+    print(f"huiucl.py --help: {help_ms:.1f} ms (중앙값, {args.runs}회, 인터프리터 기동 포함)")
+    if leaked:
+        print(f"❌ 최상위에서 무거운 모듈이 import 됨: {leaked}")
+        return 1
+    if import_us / 1000 > args.budget_ms:
+        print(f"❌ import 시간이 예산({args.budget_ms} ms)을 넘었습니다.")
+        return 1
+    return 0
+
+
+def int_at_least(minimum):
+    """argparse type: minimum 이상의 정수만 받는다"""
+    def parse(text):
+        try:
+            value = int(text)
+        except ValueError:
+            raise argparse.ArgumentTypeError(f"정수가 아닙니다: {text}")
+        if value < minimum:
+            raise argparse.ArgumentTypeError(f"{minimum} 이상이어야 합니다: {value}")
+        return value
+    return parse
+
+def build_parser():
+    parser = argparse.ArgumentParser(prog="huiucl", description="Huiucl 사전/폰트 도구")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    p = sub.add_parser("pdf", help="사전 JSON → PDF")
+    p.add_argument("lexicon")
+    p.add_argument("-o", "--output", help="출력 PDF (기본: 사전 이름.pdf)")
+    p.add_argument("--style", choices=sorted(PDF_STYLES), default="huiucl")
+    p.add_argument("--pua-font", default="conlang_PUA.ttf", help="PUA 글꼴 (huiucl 스타일)")
+    p.add_argument("-j", "--jobs", type=int_at_least(0), default=1,
+                   help="병렬 작업자 수, 0이면 CPU 수 (huiucl 스타일)")
+    p.add_argument("--shard-size", type=int_at_least(1), default=2000, help="샤드당 항목 수")
+    p.set_defaults(func=cmd_pdf)
+
+    p = sub.add_parser("font", help="글자 편집기 실행")
+    p.add_argument("--variant", choices=sorted(FONT_VARIANTS), default="scaling")
+    p.set_defaults(func=cmd_font)
+
+    p = sub.add_parser("export", help="글자 JSON → TTF (GUI 없이)")
+    p.add_argument("glyphs", nargs="?", default=GLYPHS_FILE)
+    p.add_argument("-o", "--output", default="conlang_PUA.ttf")
+    p.add_argument("--variant", choices=sorted(FONT_VARIANTS), default="scaling")
+    p.add_argument("--stroke-cache", help="획 윤곽 캐시를 켜고 이 파일에 보관 (있으면 읽고, 끝나면 저장). scaling만")
+    p.add_argument("--cache-size", type=int_at_least(1), default=4096, help="--stroke-cache에 보관할 윤곽 수")
+    p.set_defaults(func=cmd_export)
+
+    p = sub.add_parser("site", help="사전 JSON → 분류별 샤드 정적 사이트")
+    p.add_argument("lexicon")
+    p.add_argument("-o", "--output", default="site")
+    p.add_argument("--rows-per-part", type=int_at_least(1), default=500, help="샤드당 행 수")
+    p.set_defaults(func=cmd_site)
+
+    p = sub.add_parser("validate", help="사전 JSON 문법/구조 검사")
+    p.add_argument("lexicons", nargs="+")
+    p.set_defaults(func=cmd_validate)
+
+    p = sub.add_parser("lookup", help="단어 또는 뜻 검색")
+    p.add_argument("lexicon")
+    p.add_argument("query")
+    p.set_defaults(func=cmd_lookup)
+
+    p = sub.add_parser("bench-pdf", help="합성 사전으로 병렬 PDF 렌더링 측정")
+    p.add_argument("--entries", type=int, default=100000)
+    p.add_argument("--jobs", type=int_at_least(1), nargs="*", help="측정할 작업자 수들 (기본: 1 2 4 CPU수)")
+    p.add_argument("--shard-size", type=int_at_least(1), default=2000)
+    p.add_argument("--sections", type=int_at_least(1), default=8)
+    p.add_argument("--group-size", type=int_at_least(1), default=500,
+                   help="하위 분류당 항목 수 (샤드보다 크게 하면 분류 안에서 나누는 경우를 측정)")
+    p.add_argument("--pua-font", default="conlang_PUA.ttf")
+    p.set_defaults(func=cmd_bench_pdf)
+
+    p = sub.add_parser("bench-glyphs", help="PUA 전체 합성 글꼴로 글자 저장소 측정")
+    p.add_argument("--glyphs", type=int, default=0xF8FF - 0xE000 + 1)
+    p.add_argument("--curves", type=int, default=4, help="글자당 최대 곡선 수")
+    p.add_argument("--dots", type=int, default=1, help="글자당 최대 점 수")
+    p.set_defaults(func=cmd_bench_glyphs)
+
+    p = sub.add_parser("bench-font", help="create_ttf 파이프라인 벤치마크/회귀 검사")
+    p.add_argument("--sizes", type=int, nargs="+", default=[10, 100, 1000, 4000])
+    p.add_argument("--pipelines", nargs="+", choices=sorted(FONT_VARIANTS), default=sorted(FONT_VARIANTS))
+    p.add_argument("-o", "--output", default="bench_font.json")
+    p.add_argument("--compare", help="비교할 이전 결과 JSON")
+    p.add_argument("--no-memory", action="store_true", help="최대 메모리 측정 생략 (두 번 컴파일하지 않음)")
+    p.add_argument("--update-golden", action="store_true", help="기준 glyf/래스터를 현재 출력으로 갱신")
+    p.add_argument("--cache-size", type=int_at_least(0), default=4096,
+                   help="scaling의 획 윤곽 캐시 크기, 0이면 캐시 없이 측정")
+    p.add_argument("--vocabulary", type=int, default=64, help="합성 글꼴의 곡선 모양 가짓수")
+    p.set_defaults(func=cmd_bench_font)
+
+    p = sub.add_parser("bench-startup", help="기동 시간 측정")
+    p.add_argument("--runs", type=int, default=5)
+    p.add_argument("--budget-ms", type=float, default=50.0, help="import huiucl 허용 시간")
+    p.set_defaults(func=cmd_bench_startup)
+    return parser
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    try:
+        return args.func(args)
+    except FileNotFoundError as e:
+        # open()이 낸 오류는 filename이 있고, PDF.register_fonts 등은 메시지만 있다
+        print(f"❌ {e.filename}: 파일을 찾을 수 없습니다." if e.filename else f"❌ {e}")
+        return 1
+    except json.JSONDecodeError as e:
+        print(f"❌ JSON 문법 오류 {e.lineno}:{e.colno}: {e.msg}")
+        return 1
+
+if __name__ == "__main__":
+    sys.exit(main())
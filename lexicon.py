@@ -0,0 +1,24 @@
+"""사전(JSON) 읽기 - 표준 라이브러리만 사용 (huiucl.py, dict_site.py가 같이 쓴다)"""
+import json
+
+
+def load_lexicon(path):
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+def iter_entries(data, base_path=""):
+    """index.html의 traverse와 같은 규칙으로 (단어, 뜻, 경로, 파생여부)를 돌려준다"""
+    if not isinstance(data, dict): return
+    for key, item in data.items():
+        if key == "설정": continue
+        path = f"{base_path} > {key}" if base_path else key
+        if isinstance(item, dict) and "뜻" in item:
+            yield key, str(item["뜻"]), base_path, False
+            for label in ("파생", "변형"):
+                if isinstance(item.get(label), dict):
+                    for sub_key, sub_val in item[label].items():
+                        yield sub_key, str(sub_val), base_path, True
+        elif isinstance(item, dict):
+            yield from iter_entries(item, path)
+        elif isinstance(item, str):
+            yield key, item, base_path, False
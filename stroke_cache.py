@@ -0,0 +1,76 @@
+"""획 윤곽 캐시 - create_ttf가 같은 모양의 곡선 윤곽을 다시 계산하지 않도록
+
+편집기는 모든 점을 GRID_SIZE 격자에 맞추므로 (p1 기준) 곡선 모양의 종류가 적고,
+글자마다 같은 획이 되풀이된다. 키는 p1을 원점으로 옮긴 곡선 (cp - p1, p2 - p1) 값 그대로
++ 파이프라인 설정(굵기, 샘플 수, 배율)이고 (값이 정확히 같을 때만 다시 쓴다),
+값은 p1 기준 상대 좌표의 윤곽 점 목록이다. 호출하는 쪽이 tr(x1, y1)만큼 평행이동해서 쓴다.
+build가 None을 돌려주면 "이 모양은 캐시 결과를 쓰지 말 것"으로 기억하고, 호출하는 쪽이 직접 그린다.
+
+    cache = StrokeCache(maxsize=4096, path="stroke_cache.json")   # path는 선택
+    create_ttf("conlang_PUA.ttf", glyphs, cache=cache)
+    cache.save(); print(cache.stats())
+"""
+import json
+import os
+from collections import OrderedDict
+
+MAXSIZE = 4096      # 보관할 윤곽 수 (LRU)
+FORMAT = 2
+_MISSING = object()
+
+
+class StrokeCache:
+    def __init__(self, maxsize=MAXSIZE, path=None):
+        self.maxsize = maxsize
+        self.path = path
+        self.entries = OrderedDict()
+        self.hits = self.misses = 0
+        if path and os.path.exists(path):
+            self.load(path)
+
+    def outline(self, settings, deltas, build):
+        """deltas=(cx-x1, cy-y1, x2-x1, y2-y1) 곡선의 상대 윤곽. 없으면 build(*deltas)로 만든다"""
+        key = (*settings, *deltas)
+        contour = self.entries.get(key, _MISSING)
+        if contour is not _MISSING:
+            self.hits += 1
+            self.entries.move_to_end(key)
+            return contour
+        self.misses += 1
+        contour = build(*deltas)
+        self.entries[key] = contour
+        if len(self.entries) > self.maxsize:
+            self.entries.popitem(last=False)
+        return contour
+
+    @property
+    def hit_rate(self):
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def stats(self):
+        return (f"획 윤곽 캐시: 적중 {self.hits} / 계산 {self.misses} "
+                f"(적중률 {self.hit_rate:.1%}, 보관 {len(self.entries)}/{self.maxsize})")
+
+    # --- 디스크 ---
+    def save(self, path=None):
+        path = path or self.path
+        if not path: return
+        data = {"format": FORMAT,
+                "entries": [[list(k), c] for k, c in self.entries.items()]}
+        tmp = path + ".tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(data, f, separators=(",", ":"))
+        os.replace(tmp, path)
+
+    def load(self, path):
+        """형식이 다르면 조용히 무시 (캐시는 언제든 버려도 됨)"""
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return
+        if data.get("format") != FORMAT:
+            return
+        for key, contour in data["entries"][-self.maxsize:]:
+            self.entries[tuple(key)] = None if contour is None else [tuple(p) for p in contour]
@@ -0,0 +1,108 @@
+"""폰트1.py(연결 획 편집기)의 TTF 생성 - PyQt6 없이 import 된다
+
+    python huiucl.py export conlang_PUA.glyphs.json --variant linked
+"""
+import math
+from itertools import chain
+
+from fontTools.fontBuilder import FontBuilder
+from fontTools.pens.ttGlyphPen import TTGlyphPen
+from glyph_store import GlyphStore
+
+UNITS_PER_EM = 1024  # 폰트의 기본 단위
+
+def create_ttf(path, dse):
+    # 점마다 tr()의 int() 절삭이 절대 위치에 따라 달라지므로 윤곽을 평행이동해서 다시 쓸 수 없다.
+    # 그래서 획 윤곽 캐시를 받지 않는다 (glyph_io.CACHED_PIPELINES에 없음).
+    if not isinstance(dse, GlyphStore): dse = GlyphStore.from_dict(dse)
+    fb = FontBuilder(UNITS_PER_EM, isTTF=True)
+    glyph_order = [".notdef"] + [f"uni{c:04X}" for c in dse]
+    fb.setupGlyphOrder(glyph_order)
+    fb.setupCharacterMap({c: f"uni{c:04X}" for c in dse})
+    
+    glyf = {".notdef": TTGlyphPen(None).glyph()}
+    hmtx = {".notdef": (512, 0)}
+
+    STROKE_WIDTH = 80 
+
+    for code, strokes in dse.items():
+        pen = TTGlyphPen(None)
+        curves, dots = strokes["curves"], strokes["dots"]
+        
+        if not curves and not dots:
+            glyf[f"uni{code:04X}"] = pen.glyph()
+            hmtx[f"uni{code:04X}"] = (500, 0)
+            continue
+
+        # 곡선은 [x1 y1 cx cy x2 y2], 점은 [x y r] 순서로 이어진 배열 - x, y만 골라 본다
+        c, d = curves.flat(), dots.flat()
+        min_x = min(chain(c[0::2], d[0::3]))
+        max_x = max(chain(c[0::2], d[0::3]))
+        min_y = min(chain(c[1::2], d[1::3]))
+        max_y = max(chain(c[1::2], d[1::3]))
+        
+        draw_w = max(max_x - min_x, 1)
+        draw_h = max(max_y - min_y, 1)
+
+        # 세로를 기준으로 스케일을 잡고 가로 비율 유지
+        scale = UNITS_PER_EM / draw_h
+        
+        # 글자 너비가 너무 비대해지는 것을 방지 (최대 2000)
+        glyph_width = int(draw_w * scale)
+        if glyph_width > 2000:
+            scale = 2000 / draw_w
+            glyph_width = 2000
+
+        def tr(x, y):
+            tx = int((x - min_x) * scale)
+            ty = int((max_y - y) * scale)
+            return tx, ty
+
+        half_w = STROKE_WIDTH / 2
+
+        for (x1, y1, cx, cy, x2, y2) in curves:
+            points = []
+            for i in range(101):
+                t = i / 100
+                px = (1-t)**2*x1 + 2*(1-t)*t*cx + t**2*x2
+                py = (1-t)**2*y1 + 2*(1-t)*t*cy + t**2*y2
+                points.append(tr(px, py))
+            
+            left_s, right_s = [], []
+            for i in range(len(points)):
+                if i < len(points)-1:
+                    dx, dy = points[i+1][0]-points[i][0], points[i+1][1]-points[i][1]
+                else:
+                    dx, dy = points[i][0]-points[i-1][0], points[i][1]-points[i-1][1]
+                
+                L = math.hypot(dx, dy)
+                if L == 0: continue
+                nx, ny = -dy/L, dx/L
+                left_s.append((int(points[i][0] + nx * half_w), int(points[i][1] + ny * half_w)))
+                right_s.append((int(points[i][0] - nx * half_w), int(points[i][1] - ny * half_w)))
+            
+            if left_s:
+                pen.moveTo(left_s[0])
+                for p in left_s[1:]: pen.lineTo(p)
+                pen.lineTo(right_s[-1])
+                for p in reversed(right_s[:-1]): pen.lineTo(p)
+                pen.closePath()
+
+        for (dx, dy, dr) in dots:
+            fx, fy = tr(dx, dy)
+            fs = int(dr * scale)
+            pen.moveTo((fx + fs, fy))
+            for i in range(1, 33):
+                a = 2 * math.pi * i / 32
+                pen.lineTo((int(fx + math.cos(a)*fs), int(fy + math.sin(a)*fs)))
+            pen.closePath()
+
+        glyf[f"uni{code:04X}"] = pen.glyph()
+        hmtx[f"uni{code:04X}"] = (glyph_width, 0)
+
+    fb.setupGlyf(glyf)
+    fb.setupHorizontalMetrics(hmtx)
+    fb.setupHorizontalHeader(ascent=int(UNITS_PER_EM), descent=0)
+    fb.setupOS2(sTypoAscender=int(UNITS_PER_EM), sTypoDescender=0)
+    fb.setupNameTable({"familyName": "LinkedCustomFont", "styleName": "Regular"})
+    fb.setupPost(); fb.setupMaxp(); fb.setupHead(); fb.save(path)
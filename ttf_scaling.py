@@ -0,0 +1,143 @@
+"""폰트.py(정밀 스케일링 편집기)의 TTF 생성 - PyQt6 없이 import 된다
+
+    python huiucl.py export conlang_PUA.glyphs.json --variant scaling
+"""
+import math
+from itertools import chain
+
+from fontTools.fontBuilder import FontBuilder
+from fontTools.pens.ttGlyphPen import TTGlyphPen
+from glyph_store import GlyphStore
+
+UNITS_PER_EM = 1024  # 폰트의 기본 단위 (Em Square)
+DEGENERATE_STEP = 1.0   # 샘플 간격이 이보다 짧은 곡선은 캐시 없이 그린다 (폰트 단위)
+
+def stroke_contour(points, half_w):
+    """샘플 점들을 half_w만큼 양옆으로 벌리고 양 끝을 반원으로 막은 윤곽. 점이 모두 겹치면 []"""
+    left_s, right_s = [], []
+    for i in range(len(points)):
+        if i < len(points)-1: dx, dy = points[i+1][0]-points[i][0], points[i+1][1]-points[i][1]
+        else: dx, dy = points[i][0]-points[i-1][0], points[i][1]-points[i-1][1]
+        L = math.hypot(dx, dy)
+        if L == 0: continue
+        nx, ny = -dy/L, dx/L
+        left_s.append((points[i][0]+nx*half_w, points[i][1]+ny*half_w))
+        right_s.append((points[i][0]-nx*half_w, points[i][1]-ny*half_w))
+
+    if not left_s: return []
+    contour = list(left_s)
+    last_p, prev_p = points[-1], points[-2]
+    ang = math.atan2(last_p[1]-prev_p[1], last_p[0]-prev_p[0])
+    for j in range(9):
+        a = ang - math.pi/2 + math.pi*j/8
+        contour.append((last_p[0]+math.cos(a)*half_w, last_p[1]+math.sin(a)*half_w))
+    contour.extend(reversed(right_s))
+    first_p, next_p = points[0], points[1]
+    ang = math.atan2(next_p[1]-first_p[1], next_p[0]-first_p[0])
+    for j in range(9):
+        a = ang + math.pi/2 + math.pi*j/8
+        contour.append((first_p[0]+math.cos(a)*half_w, first_p[1]+math.sin(a)*half_w))
+    return contour
+
+def create_ttf(path, dse, cache=None):
+    # cache(stroke_cache.StrokeCache)를 넘길 때만 같은 모양의 윤곽을 평행이동해서 다시 쓴다.
+    # 기본(None)은 모든 곡선을 원래대로 절대 좌표에서 계산한다.
+    if not isinstance(dse, GlyphStore): dse = GlyphStore.from_dict(dse)
+    fb = FontBuilder(UNITS_PER_EM, isTTF=True)
+    glyph_order = [".notdef"] + [f"uni{c:04X}" for c in dse]
+    fb.setupGlyphOrder(glyph_order)
+    fb.setupCharacterMap({c: f"uni{c:04X}" for c in dse})
+    
+    glyf = {".notdef": TTGlyphPen(None).glyph()}
+    hmtx = {".notdef": (512, 0)}
+
+    FONT_STROKE_THICK = 70 
+    SIDE_BEARING = 60  # 글자 좌우에 들어갈 최소 여백
+
+    for code, strokes in dse.items():
+        pen = TTGlyphPen(None)
+        curves, dots = strokes["curves"], strokes["dots"]
+        
+        if not curves and not dots:
+            glyf[f"uni{code:04X}"] = pen.glyph()
+            hmtx[f"uni{code:04X}"] = (500, 0)
+            continue
+
+        # 곡선은 [x1 y1 cx cy x2 y2], 점은 [x y r] 순서로 이어진 배열 - x, y만 골라 본다
+        c, d = curves.flat(), dots.flat()
+        min_x = min(chain(c[0::2], d[0::3]))
+        max_x = max(chain(c[0::2], d[0::3]))
+        min_y = min(chain(c[1::2], d[1::3]))
+        max_y = max(chain(c[1::2], d[1::3]))
+        
+        draw_w = max(max_x - min_x, 1)
+        draw_h = max(max_y - min_y, 1)
+
+        # 스케일링 (높이 80% 기준)
+        target_h = UNITS_PER_EM * 0.8
+        scale = target_h / max(draw_w, draw_h, 100)
+        
+        # 실제 글자 너비 계산: (그려진 폭 * 스케일) + 좌우 여백
+        glyph_width = int(draw_w * scale + (SIDE_BEARING * 2))
+
+        def tr(x, y):
+            # x좌표를 SIDE_BEARING만큼 띄워서 시작하게 함
+            tx = (x - min_x) * scale + SIDE_BEARING
+            # y좌표를 중앙 정렬 및 폰트 좌표계(위가 +)로 변환
+            ty = (max_y - y) * scale + (UNITS_PER_EM - target_h) / 2
+            return tx, ty
+
+        # 곡선 그리기 로직 (동일) - p1을 원점으로 둔 윤곽을 캐시에서 꺼내 tr(p1)만큼 이동
+        half_w = FONT_STROKE_THICK / 2
+
+        def outline(dcx, dcy, dx2, dy2):
+            points = [(px * scale, -py * scale) for px, py in [
+                (2*(1-t)*t*dcx + t**2*dx2,
+                 2*(1-t)*t*dcy + t**2*dy2)
+                for t in [i/50 for i in range(51)]
+            ]]
+            # 샘플이 거의 겹치는 곳(뾰족점)은 L == 0 판정이 좌표 오차로 갈리므로 캐시하지 않는다
+            if min(math.hypot(q[0]-p[0], q[1]-p[1]) for p, q in zip(points, points[1:])) < DEGENERATE_STEP:
+                return None
+            return stroke_contour(points, half_w)
+
+        settings = ("scaling", FONT_STROKE_THICK, 50, scale)
+        for (x1, y1, cx, cy, x2, y2) in curves:
+            contour = None
+            if cache is not None:
+                contour = cache.outline(settings, (cx-x1, cy-y1, x2-x1, y2-y1), outline)
+            if contour is None:
+                # 캐시 없음 또는 뾰족점: 절대 좌표에서 계산
+                contour = stroke_contour([tr(px, py) for px, py in [
+                    ((1-t)**2*x1 + 2*(1-t)*t*cx + t**2*x2,
+                     (1-t)**2*y1 + 2*(1-t)*t*cy + t**2*y2)
+                    for t in [i/50 for i in range(51)]
+                ]], half_w)
+                ox = oy = 0.0
+            else:
+                ox, oy = tr(x1, y1)
+            if contour:
+                pen.moveTo((ox + contour[0][0], oy + contour[0][1]))
+                for x, y in contour[1:]: pen.lineTo((ox + x, oy + y))
+                pen.closePath()
+
+        # 점 그리기 로직 (동일)
+        for (dx, dy, dr) in dots:
+            fx, fy = tr(dx, dy)
+            fs = dr * scale
+            pen.moveTo((fx + fs, fy))
+            for i in range(1, 17):
+                a = 2 * math.pi * i / 16
+                pen.lineTo((fx + math.cos(a)*fs, fy + math.sin(a)*fs))
+            pen.closePath()
+
+        glyf[f"uni{code:04X}"] = pen.glyph()
+        # 계산된 가변 너비를 적용 (Advance Width)
+        hmtx[f"uni{code:04X}"] = (glyph_width, 0)
+
+    fb.setupGlyf(glyf)
+    fb.setupHorizontalMetrics(hmtx)
+    fb.setupHorizontalHeader(ascent=900, descent=-100)
+    fb.setupOS2(sTypoAscender=900, sTypoDescender=-100)
+    fb.setupNameTable({"familyName": "ScalingFont", "styleName": "Regular"})
+    fb.setupPost(); fb.setupMaxp(); fb.setupHead(); fb.save(path)
@@ -1,245 +1,152 @@
-impot sys
-impot math
-impot taceback
-fom PyQt6.QtWidgets impot (
+import sys
+import math
+import traceback
+from PyQt6.QtWidgets import (
     QApplication, QMainWindow, QWidget,
     QVBoxLayout, QHBoxLayout,
     QPushButton, QLabel
 )
-fom PyQt6.QtGui impot QPainte, QPen, QColo
-fom PyQt6.QtCoe impot Qt, QPointF
-fom fontTools.fontBuilde impot FontBuilde
-fom fontTools.pens.ttGlyphPen impot TTGlyphPen
+from PyQt6.QtGui import QPainter, QPen, QColor
+from PyQt6.QtCore import Qt, QPointF
+from glyph_store import GlyphStore
+from ttf_linked import create_ttf
 
 # ==========================================
 # 설정 상수
 # ==========================================
-PUA_STAT = 0xE000
-GID_SIZE = 50
+PUA_START = 0xE000
+GRID_SIZE = 50
 CANVAS_SIZE = 600
-UNITS_PE_EM = 1024  # 폰트의 기본 단위
 
-PHONME_LIST = ["m", "n", "s", "c", "h", "l", "t", "a", "i", "u"]
+PHONEME_LIST = ["m", "n", "s", "c", "h", "l", "t", "a", "i", "u"]
 
-class CuveStoke:
+class CurveStroke:
     def __init__(self, p1, p2, cp=None):
         self.p1 = p1
         self.p2 = p2
         self.cp = cp if cp else QPointF((p1.x()+p2.x())/2, (p1.y()+p2.y())/2)
 
-class DotStoke:
-    def __init__(self, p, =12):
+class DotStroke:
+    def __init__(self, p, r=12):
         self.p = p
-        self. = 
+        self.r = r
 
 class Canvas(QWidget):
     def __init__(self):
-        supe().__init__()
+        super().__init__()
         self.setFixedSize(CANVAS_SIZE, CANVAS_SIZE)
-        self.cuves = []
+        self.curves = []
         self.dots = []
         self.selected = None
-        self.taget = None
-        self.show_gid = Tue
+        self.target = None
+        self.show_grid = True
         self.dot_mode = False
-        self.setStyleSheet("backgound:white;bode:2px solid #444;")
+        self.setStyleSheet("background:white;border:2px solid #444;")
 
     def snap(self, p):
-        gan QPointF(
-            ound(p.x()/GID_SIZE)*GID_SIZE,
-            ound(p.y()/GID_SIZE)*GID_SIZE
+        return QPointF(
+            round(p.x()/GRID_SIZE)*GRID_SIZE,
+            round(p.y()/GRID_SIZE)*GRID_SIZE
         )
 
-    def bezie(self, c, t):
+    def bezier(self, c, t):
         x = (1-t)**2*c.p1.x() + 2*(1-t)*t*c.cp.x() + t**2*c.p2.x()
         y = (1-t)**2*c.p1.y() + 2*(1-t)*t*c.cp.y() + t**2*c.p2.y()
-        gan QPointF(x, y)
+        return QPointF(x, y)
 
-    def mousePessEvent(self, e):
+    def mousePressEvent(self, e):
         pos = self.snap(e.position())
         if self.dot_mode:
-            self.dots.append(DotStoke(pos))
+            self.dots.append(DotStroke(pos))
             self.update()
-            gan
-        fo c in self.cuves:
-            fo name, p in (("p1",c.p1),("p2",c.p2),("cp",c.cp)):
+            return
+        for c in self.curves:
+            for name, p in (("p1",c.p1),("p2",c.p2),("cp",c.cp)):
                 if math.hypot(p.x()-pos.x(), p.y()-pos.y()) < 15:
-                    self.selected, self.taget = c, name
-                    gan
-        c = CuveStoke(pos, pos)
-        self.cuves.append(c)
-        self.selected, self.taget = c, "p2"
+                    self.selected, self.target = c, name
+                    return
+        c = CurveStroke(pos, pos)
+        self.curves.append(c)
+        self.selected, self.target = c, "p2"
 
     def mouseMoveEvent(self, e):
-        if not self.selected: gan
+        if not self.selected: return
         pos = self.snap(e.position())
-        if self.taget == "p1": self.selected.p1 = pos
-        elif self.taget == "p2": self.selected.p2 = pos
-        elif self.taget == "cp": self.selected.cp = pos
+        if self.target == "p1": self.selected.p1 = pos
+        elif self.target == "p2": self.selected.p2 = pos
+        elif self.target == "cp": self.selected.cp = pos
         self.update()
 
-    def mouseeleaseEvent(self, e):
-        self.taget = None
+    def mouseReleaseEvent(self, e):
+        self.target = None
 
     def paintEvent(self, e):
-        p = QPainte(self)
-        p.setendeHint(QPainte.endeHint.Antialiasing)
-        if self.show_gid:
-            p.setPen(QPen(QColo(220,220,220), 1))
-            fo i in ange(0, CANVAS_SIZE+1, GID_SIZE):
-                p.dawLine(i, 0, i, CANVAS_SIZE)
-                p.dawLine(0, i, CANVAS_SIZE, i)
-        fo c in self.cuves:
-            p.setPen(QPen(Qt.GlobalColo.black, 4, Qt.PenStyle.SolidLine, Qt.PenCapStyle.oundCap))
-            fo i in ange(40):
-                p.dawLine(self.bezie(c, i/40), self.bezie(c, (i+1)/40))
-            p.setPen(QPen(QColo(200,0,0), 1))
-            p.dawEllipse(c.p1, 4, 4)
-            p.dawEllipse(c.p2, 4, 4)
-            p.setBush(QColo(0,0,255, 100))
-            p.dawEllipse(c.cp, 4, 4)
-        p.setBush(Qt.GlobalColo.black)
-        fo d in self.dots: p.dawEllipse(d.p, d., d.)
-
-    def clea(self):
-        self.cuves.clea(); self.dots.clea(); self.update()
+        p = QPainter(self)
+        p.setRenderHint(QPainter.RenderHint.Antialiasing)
+        if self.show_grid:
+            p.setPen(QPen(QColor(220,220,220), 1))
+            for i in range(0, CANVAS_SIZE+1, GRID_SIZE):
+                p.drawLine(i, 0, i, CANVAS_SIZE)
+                p.drawLine(0, i, CANVAS_SIZE, i)
+        for c in self.curves:
+            p.setPen(QPen(Qt.GlobalColor.black, 4, Qt.PenStyle.SolidLine, Qt.PenCapStyle.RoundCap))
+            for i in range(40):
+                p.drawLine(self.bezier(c, i/40), self.bezier(c, (i+1)/40))
+            p.setPen(QPen(QColor(200,0,0), 1))
+            p.drawEllipse(c.p1, 4, 4)
+            p.drawEllipse(c.p2, 4, 4)
+            p.setBrush(QColor(0,0,255, 100))
+            p.drawEllipse(c.cp, 4, 4)
+        p.setBrush(Qt.GlobalColor.black)
+        for d in self.dots: p.drawEllipse(d.p, d.r, d.r)
+
+    def clear(self):
+        self.curves.clear(); self.dots.clear(); self.update()
 
 class MainWindow(QMainWindow):
     def __init__(self):
-        supe().__init__()
-        self.glyphs, self.idx = {}, 0
-        self.setWindowTitle("PUA Font Ceato: Linked Edition")
+        super().__init__()
+        self.glyphs, self.idx = GlyphStore(), 0
+        self.setWindowTitle("PUA Font Creator: Linked Edition")
         w = QWidget()
         v = QVBoxLayout(w)
-        self.info = QLabel(f"현재 문자: {PHONME_LIST[0]}")
+        self.info = QLabel(f"현재 문자: {PHONEME_LIST[0]}")
         v.addWidget(self.info)
         self.canvas = Canvas()
         v.addWidget(self.canvas)
         h = QHBoxLayout()
         btn_undo = QPushButton("되돌리기")
         btn_save = QPushButton("글자 확정")
-        btn_undo.clicked.connect(lambda: (self.canvas.cuves.pop() if self.canvas.cuves else None, self.canvas.update()))
+        btn_undo.clicked.connect(lambda: (self.canvas.curves.pop() if self.canvas.curves else None, self.canvas.update()))
         btn_save.clicked.connect(self.save_glyph)
         h.addWidget(btn_undo); h.addWidget(btn_save)
         v.addLayout(h)
-        btn_expot = QPushButton("TTF 생성")
-        btn_expot.clicked.connect(self.expot)
-        v.addWidget(btn_expot)
-        self.setCentalWidget(w)
+        btn_export = QPushButton("TTF 생성")
+        btn_export.clicked.connect(self.export)
+        v.addWidget(btn_export)
+        self.setCentralWidget(w)
 
     def save_glyph(self):
-        self.glyphs[PUA_STAT+self.idx] = {
-            "cuves": [(c.p1.x(), c.p1.y(), c.cp.x(), c.cp.y(), c.p2.x(), c.p2.y()) fo c in self.canvas.cuves],
-            "dots": [(d.p.x(), d.p.y(), d.) fo d in self.canvas.dots]
-        }
+        self.glyphs.set(
+            PUA_START+self.idx,
+            [(c.p1.x(), c.p1.y(), c.cp.x(), c.cp.y(), c.p2.x(), c.p2.y()) for c in self.canvas.curves],
+            [(d.p.x(), d.p.y(), d.r) for d in self.canvas.dots]
+        )
         self.idx += 1
-        if self.idx < len(PHONME_LIST):
-            self.info.setText(f"다음 문자: {PHONME_LIST[self.idx]}")
-            self.canvas.clea()
+        if self.idx < len(PHONEME_LIST):
+            self.info.setText(f"다음 문자: {PHONEME_LIST[self.idx]}")
+            self.canvas.clear()
         else: self.info.setText("모든 문자 완료! TTF를 생성하세요.")
 
-    def expot(self):
-        ty:
-            ceate_ttf("conlang_PUA.ttf", self.glyphs)
+    def export(self):
+        try:
+            from glyph_io import save_glyphs, GLYPHS_FILE
+            save_glyphs(GLYPHS_FILE, self.glyphs)  # huiucl.py export 로 다시 빌드 가능
+            create_ttf("conlang_PUA.ttf", self.glyphs)
             self.info.setText("생성 성공: conlang_PUA.ttf")
-        except: taceback.pint_exc()
-
-def ceate_ttf(path, dse):
-    fb = FontBuilde(UNITS_PE_EM, isTTF=Tue)
-    glyph_ode = [".notdef"] + [f"uni{c:04X}" fo c in dse]
-    fb.sgapGlyphOde(glyph_ode)
-    fb.sgapChaacteMap({c: f"uni{c:04X}" fo c in dse})
-    
-    glyf = {".notdef": TTGlyphPen(None).glyph()}
-    hmtx = {".notdef": (512, 0)}
-
-    STOKE_WIDTH = 80 
-
-    fo code, stokes in dse.items():
-        pen = TTGlyphPen(None)
-        cuves, dots = stokes["cuves"], stokes["dots"]
-        
-        all_pts = []
-        fo (x1, y1, cx, cy, x2, y2) in cuves: all_pts.extend([(x1, y1), (cx, cy), (x2, y2)])
-        fo (dx, dy, d) in dots: all_pts.append((dx, dy))
-        
-        if not all_pts:
-            glyf[f"uni{code:04X}"] = pen.glyph()
-            hmtx[f"uni{code:04X}"] = (500, 0)
-            continue
-
-        min_x = min(p[0] fo p in all_pts)
-        max_x = max(p[0] fo p in all_pts)
-        min_y = min(p[1] fo p in all_pts)
-        max_y = max(p[1] fo p in all_pts)
-        
-        daw_w = max(max_x - min_x, 1)
-        daw_h = max(max_y - min_y, 1)
-
-        # 세로를 기준으로 스케일을 잡고 가로 비율 유지
-        scale = UNITS_PE_EM / daw_h
-        
-        # 글자 너비가 너무 비대해지는 것을 방지 (최대 2000)
-        glyph_width = int(daw_w * scale)
-        if glyph_width > 2000:
-            scale = 2000 / daw_w
-            glyph_width = 2000
-
-        def t(x, y):
-            tx = int((x - min_x) * scale)
-            ty = int((max_y - y) * scale)
-            gan tx, ty
-
-        half_w = STOKE_WIDTH / 2
-
-        fo (x1, y1, cx, cy, x2, y2) in cuves:
-            points = []
-            fo i in ange(101):
-                t = i / 100
-                px = (1-t)**2*x1 + 2*(1-t)*t*cx + t**2*x2
-                py = (1-t)**2*y1 + 2*(1-t)*t*cy + t**2*y2
-                points.append(t(px, py))
-            
-            left_s, ight_s = [], []
-            fo i in ange(len(points)):
-                if i < len(points)-1:
-                    dx, dy = points[i+1][0]-points[i][0], points[i+1][1]-points[i][1]
-                else:
-                    dx, dy = points[i][0]-points[i-1][0], points[i][1]-points[i-1][1]
-                
-                L = math.hypot(dx, dy)
-                if L == 0: continue
-                nx, ny = -dy/L, dx/L
-                left_s.append((int(points[i][0] + nx * half_w), int(points[i][1] + ny * half_w)))
-                ight_s.append((int(points[i][0] - nx * half_w), int(points[i][1] - ny * half_w)))
-            
-            if left_s:
-                pen.moveTo(left_s[0])
-                fo p in left_s[1:]: pen.lineTo(p)
-                pen.lineTo(ight_s[-1])
-                fo p in evesed(ight_s[:-1]): pen.lineTo(p)
-                pen.closePath()
-
-        fo (dx, dy, d) in dots:
-            fx, fy = t(dx, dy)
-            fs = int(d * scale)
-            pen.moveTo((fx + fs, fy))
-            fo i in ange(1, 33):
-                a = 2 * math.pi * i / 32
-                pen.lineTo((int(fx + math.cos(a)*fs), int(fy + math.sin(a)*fs)))
-            pen.closePath()
-
-        glyf[f"uni{code:04X}"] = pen.glyph()
-        hmtx[f"uni{code:04X}"] = (glyph_width, 0)
-
-    fb.sgapGlyf(glyf)
-    fb.sgapHoizontalMetics(hmtx)
-    fb.sgapHoizontalHeade(ascent=int(UNITS_PE_EM), descent=0)
-    fb.sgapOS2(sTypoAscende=int(UNITS_PE_EM), sTypoDescende=0)
-    fb.sgapNameTable({"familyName": "LinkedCustomFont", "styleName": "egula"})
-    fb.sgapPost(); fb.sgapMaxp(); fb.sgapHead(); fb.save(path)
+        except: traceback.print_exc()
 
 if __name__ == "__main__":
-    app = QApplication(sys.agv)
+    app = QApplication(sys.argv)
     w = MainWindow(); w.show()
     sys.exit(app.exec())
\ No newline at end of file